@@ -2,15 +2,17 @@ import pandas as pd
 
 
 from src.preprocess import preprocess_mobile_data
-from src.data_process import process_launched_data
+from src.backends import get_backend
+from src.data_process import process_launched_data, process_upcoming_data
 from src.visualization import visualize_launched_phones
-from src.mobile_prediction import analyze_mobile_trends
+from src.mobile_prediction import analyze_mobile_trends, predict_upcoming_phones
 
-def main():
+def main(backend='pandas'):
     raw_path = 'data/raw/mobile.csv'
     preprocess_dir = 'data/preprocess'
+    steps = get_backend(backend)
     try:
-        preprocess_mobile_data(raw_path, preprocess_dir)
+        preprocess_mobile_data(raw_path, preprocess_dir, steps['clean'], steps['transform'])
         print("Preprocessing completed.")
     except Exception as e:
         print("Preprocess failed:", e)
@@ -19,11 +21,21 @@ def main():
     launched_input_path = f'{preprocess_dir}/mobile_launched.csv'
     launched_output_path = f'{preprocess_dir}/mobile_launched_cleaned.csv'
     try:
-        process_launched_data(launched_input_path, launched_output_path)
+        process_launched_data(launched_input_path, launched_output_path,
+                              families=steps['families'], ranges=steps['ranges'])
         print("Launched data processing completed.")
     except Exception as e:
         print("Processing launched data failed:", e)
 
+    upcoming_input_path = f'{preprocess_dir}/mobile_upcoming_rumored.csv'
+    upcoming_output_path = f'{preprocess_dir}/mobile_upcoming_cleaned.csv'
+    try:
+        process_upcoming_data(upcoming_input_path, upcoming_output_path,
+                              families=steps['families'], ranges=steps['ranges'])
+        print("Upcoming data processing completed.")
+    except Exception as e:
+        print("Processing upcoming data failed:", e)
+
     # Visualize launched phones if cleaned file exists
     try:
         df_launched = pd.read_csv(launched_output_path)
@@ -36,7 +48,7 @@ def main():
 
     # Analyze mobile trends and capture returned trends
     try:
-        launched_trends, upcoming_trends = analyze_mobile_trends()
+        launched_trends, upcoming_trends = analyze_mobile_trends(backend)
     except Exception as e:
         print("Trend analysis failed:", e)
         launched_trends, upcoming_trends = None, None
@@ -51,6 +63,15 @@ def main():
     except Exception as e:
         print("Saving top upcoming brands failed:", e)
 
+    # Score upcoming/rumored phones with the model trained on launched phones
+    try:
+        predictions = predict_upcoming_phones(launched_output_path, upcoming_output_path)
+        top_path = 'data/processed/top_upcoming_phones_by_predicted_score.csv'
+        save_top_upcoming_brands(predictions, top_path)
+        print("Top upcoming phones by predicted score saved to", top_path)
+    except Exception as e:
+        print("Upcoming phone prediction failed:", e)
+
     print("Mobile data processing and analysis completed.")
     print('=' * 50)
     return
@@ -0,0 +1,273 @@
+import numpy as np
+import pandas as pd
+
+from src.preprocess import initial_cleaning, transform_mobile_data, rearrange_columns
+from src.data_process import add_family_columns, add_range_columns
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+# Execution backends for the preprocessing, family/range and trend stages.
+# 'pandas' runs the eager reference steps from preprocess.py and data_process.py.
+# 'polars' runs each stage as one lazy plan, so the splits and fills inside a
+# stage (or the trend aggregation) are optimized together and run multithreaded.
+# Stages still exchange pandas frames, and the pipeline writes mobile_cleaned.csv
+# between clean and transform, so nothing is fused across stages and no
+# predicate/projection pushdown reaches the CSV reads.
+DEFAULT_BACKEND = 'pandas'
+
+PRICE_BINS = [0, 2000, 4000, 6000, 8000, 12000, float("inf")]
+PRICE_LABELS = ["0-2K(Low)", "2K-4K(Low)", "4K-6K(Mid)", "6K-8K(Mid)", "8K-12K(High)", ">=12K(High)"]
+# pandas 3 keeps missing values through astype(str); earlier versions render them as 'nan'
+_STR_NA = pd.Series([np.nan], dtype=object).astype(str).iloc[0]
+_STR_NA = None if pd.isna(_STR_NA) else _STR_NA
+
+TREND_COLUMNS = ['Brand Family', 'Spec Score', 'Rating', 'Price_numeric', 'Processor Family', 'RAM_GB', 'Storage_GB']
+
+def _safe_mode(series, default='Unknown'):
+    s = series.dropna()
+    if s.empty:
+        return default
+    m = s.mode()
+    return m.iloc[0] if not m.empty else default
+
+# pandas reference implementation, built from the preprocess.py steps
+
+def _pandas_trends(df):
+    # Create price bins only when we have numeric prices
+    if df['Price_numeric'].notna().any():
+        price_range = pd.cut(df['Price_numeric'], bins=PRICE_BINS, labels=PRICE_LABELS)
+    else:
+        price_range = pd.Series([np.nan] * len(df), index=df.index)
+    df = df.assign(**{'Price Range': price_range})
+
+    agg_dict = {
+        "Spec Score": "mean",
+        "Rating": "mean",
+        "Price_numeric": "mean",
+        "Price Range": lambda x: _safe_mode(x, default="Unknown"),
+        "Processor Family": lambda x: _safe_mode(x, default="Unknown"),
+        "RAM_GB": lambda x: _safe_mode(x, default=np.nan),
+        "Storage_GB": lambda x: _safe_mode(x, default=np.nan),
+    }
+    return df.groupby("Brand Family", observed=True).agg(agg_dict).reset_index()
+
+# polars lazy implementation; each step extends its stage's plan until the stage collects
+
+def _pl_text(col, null=_STR_NA):
+    # Mirrors pandas astype(str) on the installed pandas version
+    text = pl.col(col).cast(pl.String)
+    return text if null is None else text.fill_null(null)
+
+def _pl_nan_to_null(expr):
+    return pl.when(expr == 'nan').then(None).otherwise(expr)
+
+def _pl_mode(col):
+    # pandas returns modes sorted, so ties resolve to the smallest value
+    return pl.col(col).drop_nulls().mode().sort().first()
+
+def _polars_standardize_and_fill(lf, cols):
+    text_cols = ['Brand Name', 'Tag', 'SIM / Network', 'Processor', 'Storage', 'Battery', 'Display', 'Camera', 'Memory External', 'OS Version']
+    fill_cols = ['Battery', 'Storage', 'Processor', 'SIM / Network', 'Display', 'Camera', 'Memory External', 'OS Version']
+    exprs = []
+    for c in text_cols:
+        if c in cols:
+            text = _pl_text(c).str.strip_chars().str.to_lowercase()
+            exprs.append((text.fill_null('Unknown') if c in fill_cols else text).alias(c))
+    for c in ['Price', 'Spec Score', 'Rating']:
+        if c not in cols:
+            continue
+        # pandas to_numeric leaves integer columns as integers; anything else parses to float
+        if cols[c].is_integer():
+            exprs.append(pl.col(c))
+            continue
+        num = pl.col(c).cast(pl.Float64, strict=False)
+        exprs.append(num.fill_null(num.mean()).alias(c))
+    return lf.with_columns(exprs)
+
+def _polars_split_processor(lf):
+    parts = _pl_text('Processor').str.splitn(',', 3)
+    speed = _pl_nan_to_null(parts.struct.field('field_2').str.strip_chars()).str.to_lowercase()
+    speed = speed.str.replace_all('ghz', '', literal=True).str.replace_all(r'[^0-9\.]', '')
+    return lf.with_columns(
+        _pl_nan_to_null(parts.struct.field('field_0').str.strip_chars()).alias('Processor Name'),
+        _pl_nan_to_null(parts.struct.field('field_1').str.strip_chars()).alias('Processor Type'),
+        pl.when(speed.str.len_chars() > 0).then(speed + ' GHz').alias('Processor Speed'),
+    ).drop('Processor')
+
+def _polars_split_sim(lf):
+    parts = (_pl_text('SIM / Network').str.split(',')
+             .list.eval(pl.element().str.strip_chars().str.to_lowercase())
+             .list.eval(pl.element().filter(pl.element().str.len_chars() > 0)))
+    has_volte = parts.list.contains('volte')
+    idx = parts.list.eval(pl.element() == 'volte').list.arg_max()
+    sim_type = (pl.when(has_volte).then(parts.list.head(idx + 1).list.join(', '))
+                .when(parts.list.len() > 0).then(parts.list.join(', ')))
+    extra = pl.when(has_volte & (parts.list.len() > idx + 1)).then(parts.list.slice(idx + 1).list.join(', '))
+    return lf.with_columns(sim_type.alias('SIM Type'), extra.alias('Extra Feature')).drop('SIM / Network')
+
+def _polars_split_storage(lf):
+    parts = _pl_text('Storage').str.splitn(',', 2)
+    return lf.with_columns(
+        _pl_nan_to_null(parts.struct.field('field_0').str.strip_chars().str.to_lowercase()).alias('RAM'),
+        _pl_nan_to_null(parts.struct.field('field_1').str.strip_chars().str.to_lowercase()).alias('Internal Storage'),
+    ).drop('Storage')
+
+def _polars_split_battery(lf):
+    battery = pl.col('Battery').cast(pl.String).str.to_lowercase()
+    capacity = battery.str.extract(r'(\d{3,5})\s*mah', 1)
+    watt = battery.str.extract(r'(\d{1,3})\s*w', 1)
+    fast = battery.str.contains('fast|quick|turbo|super|warp')
+    return lf.with_columns(
+        pl.when(watt.is_not_null()).then(capacity + 'mAh ' + watt + 'W').otherwise(capacity + 'mAh').alias('Battery Capacity'),
+        pl.when(battery.is_null()).then(pl.lit('Unknown'))
+        .when(fast).then(pl.lit('Fast Charging')).otherwise(pl.lit('Standard Charging')).alias('Battery Feature'),
+    ).drop('Battery')
+
+def _polars_split_display(lf):
+    display = _pl_text('Display', null='').str.to_lowercase()
+    size = display.str.extract(r'(\d+(\.\d+)?)\s*inch', 1)
+    res_pattern = r'(\d{3,4})\s*[x×]\s*(\d{3,4})\s*(?:px)?'
+    res = display.str.extract(res_pattern, 1) + 'x' + display.str.extract(res_pattern, 2)
+    hz = display.str.extract(r'(\d{2,3})\s*hz', 1) + ' Hz'
+    return lf.with_columns(
+        (size + ' inch').alias('Display Size'),
+        pl.when(hz.is_null()).then(res).when(res.is_null()).then(hz).otherwise(res + ', ' + hz).alias('Display Resolution'),
+        pl.when(display.str.contains('punch hole', literal=True)).then(pl.lit('with punch hole'))
+        .otherwise(pl.lit('no punch hole')).alias('Display Feature'),
+    ).drop('Display')
+
+def _polars_clean_memory_external(lf):
+    vals = _pl_text('Memory External').str.strip_chars().str.to_lowercase().replace(
+        {'yes': 'supported', 'y': 'supported', 'true': 'supported', 'no': 'not supported', 'n': 'not supported', 'false': 'not supported'})
+    vals = pl.when(vals.is_in(['nan', 'none', 'unknown'])).then(pl.lit('unknown')).otherwise(vals)
+    return lf.with_columns(vals.alias('Memory External'))
+
+def _polars_clean(df):
+    lf = pl.from_pandas(df).lazy()
+    cols = lf.collect_schema()
+    if 'FM Radio' in cols:
+        lf = lf.drop('FM Radio')
+    # Blank-only strings become null in every text column, as in initial_cleaning
+    blank = [pl.when(pl.col(c).str.contains(r'^\s*$')).then(None).otherwise(pl.col(c)).alias(c)
+             for c, dtype in cols.items() if dtype == pl.String and c != 'FM Radio']
+    required = [c for c in ['Brand Name', 'Price', 'Spec Score', 'Rating', 'Tag'] if c in cols]
+    lf = lf.with_columns(blank)
+    if required:
+        lf = lf.drop_nulls(subset=required)
+    return lf.collect().to_pandas()
+
+def _polars_transform(df):
+    lf = pl.from_pandas(df).lazy()
+    cols = lf.collect_schema()
+    lf = _polars_standardize_and_fill(lf, cols)
+    if 'Processor' in cols:
+        lf = _polars_split_processor(lf)
+    if 'SIM / Network' in cols:
+        lf = _polars_split_sim(lf)
+    if 'Storage' in cols:
+        lf = _polars_split_storage(lf)
+    if 'Battery' in cols:
+        lf = _polars_split_battery(lf)
+    if 'Display' in cols:
+        lf = _polars_split_display(lf)
+    if 'Memory External' in cols:
+        lf = _polars_clean_memory_external(lf)
+    # Reuse the reference column order so both backends emit the same layout
+    order = rearrange_columns(pd.DataFrame(columns=lf.collect_schema().names())).columns
+    return lf.select(list(order)).collect().to_pandas()
+
+def _pl_first_match(col, choices):
+    # Same precedence as _first_match_in_list: the first listed family found wins
+    text = pl.col(col).cast(pl.String).str.to_lowercase()
+    expr = pl.when(text.is_null()).then(pl.lit('Unknown'))
+    for fam in choices:
+        expr = expr.when(text.str.contains(fam.lower(), literal=True)).then(pl.lit(fam))
+    return expr.otherwise(pl.lit('Unknown'))
+
+def _polars_families(df, brand_families, processor_families):
+    lf = pl.from_pandas(df).lazy()
+    cols = lf.collect_schema()
+    exprs = []
+    for out_col, col, choices in [('Brand Family', 'Brand Name', brand_families),
+                                  ('Processor Family', 'Processor Name', processor_families)]:
+        exprs.append((_pl_first_match(col, choices) if col in cols else pl.lit(None, dtype=pl.String)).alias(out_col))
+    return lf.with_columns(exprs).collect().to_pandas()
+
+def _polars_ranges(df):
+    lf = pl.from_pandas(df).lazy()
+    cols = lf.collect_schema()
+    exprs = []
+    if 'Display Size' in cols:
+        size = pl.col('Display Size').cast(pl.String).str.extract(r'(\d+\.?\d*)', 1).cast(pl.Float64, strict=False)
+        exprs.append(pl.when(size.is_null()).then(pl.lit('Unknown'))
+                     .when(size < 5.0).then(pl.lit('Less than 5 inch'))
+                     .when(size < 6.0).then(pl.lit('5 to 6 inch'))
+                     .when(size < 7.0).then(pl.lit('6 to 7 inch'))
+                     .otherwise(pl.lit('More than 7 inch')).alias('Display Size Range'))
+    else:
+        exprs.append(pl.lit('Unknown').alias('Display Size Range'))
+    if 'Battery Capacity' in cols:
+        capacity = pl.col('Battery Capacity').cast(pl.String).str.extract(r'(\d{3,5})', 1).cast(pl.Int64, strict=False)
+        exprs.append(pl.when(capacity.is_null()).then(pl.lit('Unknown'))
+                     .when(capacity < 3000).then(pl.lit('Low (<3000mAh)'))
+                     .when(capacity < 4000).then(pl.lit('Medium (3000 to 4000mAh)'))
+                     .when(capacity < 5000).then(pl.lit('High (4000 to 5000mAh)'))
+                     .otherwise(pl.lit('Very High (>=5000mAh)')).alias('Battery Capacity Range'))
+    else:
+        exprs.append(pl.lit('Unknown').alias('Battery Capacity Range'))
+    return lf.with_columns(exprs).collect().to_pandas()
+
+def _polars_trends(df):
+    # Only the columns the aggregation reads are converted from pandas
+    lf = pl.from_pandas(df[TREND_COLUMNS]).lazy()
+    price = pl.col('Price_numeric').cast(pl.Float64)
+    bin_idx = pl.when(price.is_null() | (price <= PRICE_BINS[0])).then(None)
+    for i, upper in enumerate(PRICE_BINS[1:]):
+        bin_idx = bin_idx.when(price <= upper).then(pl.lit(i))
+    labels = {i: label for i, label in enumerate(PRICE_LABELS)}
+    return (
+        lf.with_columns(bin_idx.alias('Price Range'))
+        .filter(pl.col('Brand Family').is_not_null())
+        .group_by('Brand Family')
+        .agg(
+            pl.col('Spec Score').cast(pl.Float64).mean(),
+            pl.col('Rating').cast(pl.Float64).mean(),
+            price.mean().alias('Price_numeric'),
+            _pl_mode('Price Range').replace_strict(labels, return_dtype=pl.String).fill_null('Unknown'),
+            _pl_mode('Processor Family').cast(pl.String).fill_null('Unknown'),
+            _pl_mode('RAM_GB'),
+            _pl_mode('Storage_GB'),
+        )
+        .sort('Brand Family')
+        .collect()
+        .to_pandas()
+    )
+
+_BACKENDS = {
+    'pandas': {'clean': initial_cleaning, 'transform': transform_mobile_data,
+               'families': add_family_columns, 'ranges': add_range_columns, 'trends': _pandas_trends},
+    'polars': {'clean': _polars_clean, 'transform': _polars_transform,
+               'families': _polars_families, 'ranges': _polars_ranges, 'trends': _polars_trends},
+}
+
+def available_backends():
+    return [name for name in _BACKENDS if name != 'polars' or pl is not None]
+
+def get_backend(name=DEFAULT_BACKEND):
+    if name not in _BACKENDS:
+        raise ValueError(f"Unknown backend: {name}. Choose from {sorted(_BACKENDS)}")
+    if name == 'polars' and pl is None:
+        raise ImportError("The polars backend requires the 'polars' package: pip install polars")
+    return _BACKENDS[name]
+
+def clean_catalog(df, backend=DEFAULT_BACKEND):
+    return get_backend(backend)['clean'](df)
+
+def transform_catalog(df, backend=DEFAULT_BACKEND):
+    return get_backend(backend)['transform'](df)
+
+def aggregate_trends(df, backend=DEFAULT_BACKEND):
+    return get_backend(backend)['trends'](df)
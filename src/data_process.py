@@ -3,6 +3,8 @@ import pandas as pd
 import re
 import os
 
+from src.feature_store import write_feature_store
+
 def _safe_read_csv(path):
     if not os.path.isfile(path):
         raise FileNotFoundError(f"Input file not found: {path}")
@@ -63,56 +65,60 @@ def _safe_dropna(df, subset):
         return df
     return df.dropna(subset=cols, how='any')
 
-def process_launched_data(input_path='data/preprocess/mobile_launched.csv', output_path='data/preprocess/mobile_launched_cleaned.csv'):
-    df_launched = _safe_read_csv(input_path)
-    df_launched_cleaned = _safe_dropna(df_launched, ['Brand Name', 'Spec Score', 'Rating', 'Price', 'Processor Name', 'Image Preview'])
-
-    brand_families = ['Alcatel', 'Apple', 'Google', 'Infinix', 'IQOO', 'Itel', 'Motorola',
-                      'Nokia', 'OnePlus', 'Oppo', 'Poco', 'Realme', 'Samsung', 'Tecno', 'Vivo',
-                      'Xiaomi', 'ZTE']
-    df_launched_cleaned['Brand Family'] = df_launched_cleaned.get('Brand Name', pd.Series()).apply(lambda t: _first_match_in_list(t, brand_families) if not pd.isna(t) else 'Unknown')
-
-    processor_families = ['Snapdragon', 'Dimensity', 'Helio', 'Exynos', 'MediaTek', 'Bionic', 'Tensor', 'Unisoc', 'Tiger', 'Intel', 'AMD', 'Qualcomm']
-    df_launched_cleaned['Processor Family'] = df_launched_cleaned.get('Processor Name', pd.Series()).apply(lambda t: _first_match_in_list(t, processor_families) if not pd.isna(t) else 'Unknown')
-
+LAUNCHED_BRAND_FAMILIES = ['Alcatel', 'Apple', 'Google', 'Infinix', 'IQOO', 'Itel', 'Motorola',
+                           'Nokia', 'OnePlus', 'Oppo', 'Poco', 'Realme', 'Samsung', 'Tecno', 'Vivo',
+                           'Xiaomi', 'ZTE']
+LAUNCHED_PROCESSOR_FAMILIES = ['Snapdragon', 'Dimensity', 'Helio', 'Exynos', 'MediaTek', 'Bionic', 'Tensor', 'Unisoc', 'Tiger', 'Intel', 'AMD', 'Qualcomm']
+UPCOMING_BRAND_FAMILIES = ['Alcatel', 'Apple', 'Google', 'Infinix', 'HTC', 'Honor', 'IQOO', 'Itel', 'Lava', 'Moondrop', 'Motorola',
+                           'Nokia', 'Nubia', 'OnePlus', 'Oppo', 'Poco', 'Realme', 'Sharp', 'Samsung', 'Sony Xperia', 'Tecno', 'Tesla', 'Vivo',
+                           'Xiaomi', 'ZTE']
+UPCOMING_PROCESSOR_FAMILIES = ['Snapdragon', 'Dimensity', 'Helio', 'Exynos', 'MediaTek', 'Bionic', 'Tensor', 'Unisoc', 'Tiger', 'Intel', 'AMD', 'Qualcomm', 'Apple', 'Xring']
+
+def add_family_columns(df, brand_families, processor_families):
+    df['Brand Family'] = df.get('Brand Name', pd.Series()).apply(lambda t: _first_match_in_list(t, brand_families) if not pd.isna(t) else 'Unknown')
+    df['Processor Family'] = df.get('Processor Name', pd.Series()).apply(lambda t: _first_match_in_list(t, processor_families) if not pd.isna(t) else 'Unknown')
+    return df
+
+def add_range_columns(df):
     # Display Size Range
-    if 'Display Size' in df_launched_cleaned.columns:
-        df_launched_cleaned['Display Size Range'] = df_launched_cleaned['Display Size'].apply(get_display_size_range)
+    if 'Display Size' in df.columns:
+        df['Display Size Range'] = df['Display Size'].apply(get_display_size_range)
     else:
-        df_launched_cleaned['Display Size Range'] = 'Unknown'
+        df['Display Size Range'] = 'Unknown'
 
     # Battery Capacity Range
-    if 'Battery Capacity' in df_launched_cleaned.columns:
-        df_launched_cleaned['Battery Capacity Range'] = df_launched_cleaned['Battery Capacity'].apply(get_battery_capacity_range)
+    if 'Battery Capacity' in df.columns:
+        df['Battery Capacity Range'] = df['Battery Capacity'].apply(get_battery_capacity_range)
     else:
-        df_launched_cleaned['Battery Capacity Range'] = 'Unknown'
+        df['Battery Capacity Range'] = 'Unknown'
+    return df
+
+# families/ranges default to the pandas steps above; src.backends supplies alternatives
+def process_launched_data(input_path='data/preprocess/mobile_launched.csv', output_path='data/preprocess/mobile_launched_cleaned.csv',
+                          store_path='data/preprocess/mobile_launched_features.bin',
+                          families=add_family_columns, ranges=add_range_columns):
+    df_launched = _safe_read_csv(input_path)
+    df_launched_cleaned = _safe_dropna(df_launched, ['Brand Name', 'Spec Score', 'Rating', 'Price', 'Processor Name', 'Image Preview'])
+    df_launched_cleaned = families(df_launched_cleaned, LAUNCHED_BRAND_FAMILIES, LAUNCHED_PROCESSOR_FAMILIES)
+    df_launched_cleaned = ranges(df_launched_cleaned)
 
     _ensure_output_dir(output_path)
     df_launched_cleaned.to_csv(output_path, index=False)
+    # Numeric features for downstream analyses to map instead of re-parsing the CSV
+    if store_path:
+        write_feature_store(df_launched_cleaned, store_path, source_path=output_path)
     return df_launched_cleaned
 
-def process_upcoming_data(input_path='data/preprocess/mobile_upcoming_rumored.csv', output_path='data/preprocess/mobile_upcoming_cleaned.csv'):
+def process_upcoming_data(input_path='data/preprocess/mobile_upcoming_rumored.csv', output_path='data/preprocess/mobile_upcoming_cleaned.csv',
+                          store_path='data/preprocess/mobile_upcoming_features.bin',
+                          families=add_family_columns, ranges=add_range_columns):
     df_upcoming = _safe_read_csv(input_path)
     df_upcoming_cleaned = _safe_dropna(df_upcoming, ['Brand Name', 'Spec Score', 'Rating', 'Price', 'Processor Name', 'Image Preview'])
-
-    brand_families = ['Alcatel', 'Apple', 'Google', 'Infinix', 'HTC', 'Honor', 'IQOO', 'Itel', 'Lava', 'Moondrop', 'Motorola',
-                      'Nokia', 'Nubia', 'OnePlus', 'Oppo', 'Poco', 'Realme', 'Sharp', 'Samsung', 'Sony Xperia', 'Tecno', 'Tesla', 'Vivo',
-                      'Xiaomi', 'ZTE']
-    df_upcoming_cleaned['Brand Family'] = df_upcoming_cleaned.get('Brand Name', pd.Series()).apply(lambda t: _first_match_in_list(t, brand_families) if not pd.isna(t) else 'Unknown')
-
-    processor_families = ['Snapdragon', 'Dimensity', 'Helio', 'Exynos', 'MediaTek', 'Bionic', 'Tensor', 'Unisoc', 'Tiger', 'Intel', 'AMD', 'Qualcomm', 'Apple', 'Xring']
-    df_upcoming_cleaned['Processor Family'] = df_upcoming_cleaned.get('Processor Name', pd.Series()).apply(lambda t: _first_match_in_list(t, processor_families) if not pd.isna(t) else 'Unknown')
-
-    if 'Display Size' in df_upcoming_cleaned.columns:
-        df_upcoming_cleaned['Display Size Range'] = df_upcoming_cleaned['Display Size'].apply(get_display_size_range)
-    else:
-        df_upcoming_cleaned['Display Size Range'] = 'Unknown'
-
-    if 'Battery Capacity' in df_upcoming_cleaned.columns:
-        df_upcoming_cleaned['Battery Capacity Range'] = df_upcoming_cleaned['Battery Capacity'].apply(get_battery_capacity_range)
-    else:
-        df_upcoming_cleaned['Battery Capacity Range'] = 'Unknown'
+    df_upcoming_cleaned = families(df_upcoming_cleaned, UPCOMING_BRAND_FAMILIES, UPCOMING_PROCESSOR_FAMILIES)
+    df_upcoming_cleaned = ranges(df_upcoming_cleaned)
 
     _ensure_output_dir(output_path)
     df_upcoming_cleaned.to_csv(output_path, index=False)
+    if store_path:
+        write_feature_store(df_upcoming_cleaned, store_path, source_path=output_path)
     return df_upcoming_cleaned
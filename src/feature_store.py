@@ -0,0 +1,184 @@
+import os
+import json
+import struct
+import numpy as np
+import pandas as pd
+
+# On-disk layout: MAGIC | uint64 header length | JSON header | column blocks.
+# Each column is stored contiguously (column-major) and aligned so it can be
+# mapped straight into a NumPy view without parsing or copying.
+MAGIC = b'PHFSTORE'
+VERSION = 1
+_ALIGN = 64
+
+# Numeric spec features pulled from the engineered text columns: (feature, source column, pattern)
+SPEC_FEATURES = [
+    ('RAM_GB', 'RAM', r'(\d+\.?\d*)'),
+    ('Storage_GB', 'Internal Storage', r'(\d+\.?\d*)'),
+    ('Processor_GHz', 'Processor Speed', r'(\d+\.?\d*)'),
+    ('Battery_mAh', 'Battery Capacity', r'(\d{3,5})'),
+    ('Display_inch', 'Display Size', r'(\d+\.?\d*)'),
+]
+# Columns that are already numeric in the cleaned catalog: (feature, source column)
+SCORE_FEATURES = [
+    ('Price_numeric', 'Price'),
+    ('Spec Score', 'Spec Score'),
+    ('Rating', 'Rating'),
+]
+CATEGORICAL_COLUMNS = ['Brand Family', 'Processor Family', 'Tag', 'Display Size Range', 'Battery Capacity Range']
+
+def _ensure_output_dir(path):
+    out_dir = os.path.dirname(path)
+    if out_dir:
+        os.makedirs(out_dir, exist_ok=True)
+
+def source_fingerprint(path):
+    # Cheap identity for the file a store or model was derived from
+    if not path or not os.path.isfile(path):
+        return None
+    st = os.stat(path)
+    return f"{st.st_size}:{st.st_mtime_ns}"
+
+def _code_dtype(n_categories):
+    # The code width pandas picks for a categorical, so mapped codes are used without a cast
+    for dtype in (np.int8, np.int16, np.int32):
+        if n_categories < np.iinfo(dtype).max:
+            return dtype
+    return np.int64
+
+def _aligned(n):
+    return (n + _ALIGN - 1) // _ALIGN * _ALIGN
+
+def extract_numeric(df, col, pattern):
+    if col not in df.columns:
+        return np.full(len(df), np.nan)
+    # Spec strings repeat heavily, so parse each distinct value once and broadcast back by code
+    codes, uniques = pd.factorize(df[col], use_na_sentinel=True)
+    extracted = pd.Series(uniques).astype(str).str.extract(pattern, expand=False)
+    values = np.append(pd.to_numeric(extracted, errors='coerce').to_numpy(dtype=np.float64), np.nan)
+    return values[codes]
+
+def derive_numeric_features(df):
+    features = {}
+    for name, col, pattern in SPEC_FEATURES:
+        features[name] = extract_numeric(df, col, pattern)
+    for name, col in SCORE_FEATURES:
+        if col in df.columns:
+            features[name] = pd.to_numeric(df[col], errors='coerce').to_numpy(dtype=np.float64)
+        else:
+            features[name] = np.full(len(df), np.nan)
+    return features
+
+def write_feature_store(df, path, source_path=None):
+    columns = derive_numeric_features(df)
+    dictionaries = {}
+    for col in CATEGORICAL_COLUMNS:
+        if col not in df.columns:
+            continue
+        # Sorted dictionary, so code order matches string order for groupby and mode ties
+        codes, uniques = pd.factorize(df[col].astype('string'), sort=True, use_na_sentinel=True)
+        columns[col] = codes.astype(_code_dtype(len(uniques)))
+        dictionaries[col] = [str(u) for u in uniques]
+
+    # Lay out column blocks relative to the start of the data section
+    layout = []
+    offset = 0
+    for name, values in columns.items():
+        values = np.ascontiguousarray(values)
+        layout.append({'name': name, 'dtype': values.dtype.str, 'offset': offset})
+        offset = _aligned(offset + values.nbytes)
+    header = {
+        'version': VERSION,
+        'n_rows': int(len(df)),
+        'source': source_fingerprint(source_path),
+        'columns': layout,
+        'dictionaries': dictionaries,
+    }
+    header_bytes = json.dumps(header).encode('utf-8')
+    data_start = _aligned(len(MAGIC) + 8 + len(header_bytes))
+
+    # Write to a temp file and rename so concurrent readers never map a partial store
+    _ensure_output_dir(path)
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(MAGIC)
+            f.write(struct.pack('<Q', len(header_bytes)))
+            f.write(header_bytes)
+            for entry in layout:
+                f.seek(data_start + entry['offset'])
+                f.write(np.ascontiguousarray(columns[entry['name']]).tobytes())
+            f.truncate(data_start + offset)
+        os.replace(tmp_path, path)
+    except PermissionError:
+        # Windows refuses to replace a file another process has mapped. Keep the
+        # old store: its source fingerprint no longer matches, so readers fall
+        # back to parsing the CSV until the store can be rewritten.
+        os.remove(tmp_path)
+        print(f"Feature store in use, not updated: {path}")
+        return None
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return path
+
+def open_feature_store(path):
+    if not os.path.isfile(path):
+        raise FileNotFoundError(f"Feature store not found: {path}")
+    with open(path, 'rb') as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"Not a feature store file: {path}")
+        (header_len,) = struct.unpack('<Q', f.read(8))
+        header = json.loads(f.read(header_len).decode('utf-8'))
+    if header.get('version') != VERSION:
+        raise ValueError(f"Unsupported feature store version: {header.get('version')}")
+
+    # One read-only mapping for the whole file; columns are zero-copy views into it
+    data_start = _aligned(len(MAGIC) + 8 + header_len)
+    mm = np.memmap(path, dtype=np.uint8, mode='r')
+    n_rows = header['n_rows']
+    columns = {}
+    for entry in header['columns']:
+        dtype = np.dtype(entry['dtype'])
+        start = data_start + entry['offset']
+        end = start + n_rows * dtype.itemsize
+        if end > len(mm):
+            raise ValueError(f"Feature store is truncated: {path}")
+        columns[entry['name']] = mm[start:end].view(dtype)
+    return {
+        'n_rows': n_rows,
+        'source': header.get('source'),
+        'columns': columns,
+        'dictionaries': header['dictionaries'],
+    }
+
+def load_current_store(path, source_path):
+    # The store is only trusted while the CSV it was written alongside is unchanged
+    if not path or not os.path.isfile(path):
+        return None
+    try:
+        store = open_feature_store(path)
+    except (OSError, ValueError, KeyError, TypeError, struct.error):
+        # Corrupt, truncated or other-version stores are treated like stale ones
+        return None
+    fingerprint = source_fingerprint(source_path)
+    if fingerprint is None or store['source'] != fingerprint:
+        return None
+    return store
+
+def decode_categorical(store, col):
+    codes = store['columns'][col]
+    categories = store['dictionaries'][col]
+    # Wraps the mapped codes without copying when they were written at pandas' code width
+    return pd.Categorical.from_codes(codes, dtype=pd.CategoricalDtype(categories), validate=False)
+
+def feature_store_to_frame(store, columns=None):
+    names = list(store['columns']) if columns is None else columns
+    data = {}
+    for name in names:
+        if name in store['dictionaries']:
+            data[name] = decode_categorical(store, name)
+        else:
+            data[name] = store['columns'][name]
+    return pd.DataFrame(data, copy=False)
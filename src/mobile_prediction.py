@@ -1,9 +1,15 @@
 import os
+import hashlib
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+from src.backends import TREND_COLUMNS, aggregate_trends
+from src.feature_store import (
+    SPEC_FEATURES, derive_numeric_features, extract_numeric, feature_store_to_frame, load_current_store,
+)
+
 def _safe_read_csv(path):
     if not os.path.isfile(path):
         raise FileNotFoundError(f"Input file not found: {path}")
@@ -14,59 +20,23 @@ def _ensure_output_dir(path):
     if out_dir:
         os.makedirs(out_dir, exist_ok=True)
 
-def _safe_mode(series, default='Unknown'):
-    s = series.dropna()
-    if s.empty:
-        return default
-    m = s.mode()
-    return m.iloc[0] if not m.empty else default
-
-def process_mobile_trends(input_path, output_path):
+def _load_features(input_path, store_path, columns=None):
+    # Map the feature store when it is current for input_path; otherwise parse the CSV
+    store = load_current_store(store_path, input_path)
+    if store is not None:
+        names = list(store['columns']) if columns is None else [c for c in columns if c in store['columns']]
+        return feature_store_to_frame(store, names)
     df = _safe_read_csv(input_path)
+    return df.assign(**derive_numeric_features(df))
 
-    # Safe numeric extraction for RAM and Storage
-    if 'RAM' in df.columns:
-        ram_extracted = df['RAM'].astype(str).str.extract(r'(\d+\.?\d*)')[0]
-        df['RAM_GB'] = pd.to_numeric(ram_extracted, errors='coerce')
-    else:
-        df['RAM_GB'] = np.nan
-
-    if 'Internal Storage' in df.columns:
-        stor_extracted = df['Internal Storage'].astype(str).str.extract(r'(\d+\.?\d*)')[0]
-        df['Storage_GB'] = pd.to_numeric(stor_extracted, errors='coerce')
-    else:
-        df['Storage_GB'] = np.nan
-
-    # Normalize Price to numeric safely
-    if 'Price' in df.columns:
-        df['Price_numeric'] = pd.to_numeric(df['Price'], errors='coerce')
-    else:
-        df['Price_numeric'] = np.nan
-
-    # Create price bins only when we have numeric prices
-    bins = [0, 2000, 4000, 6000, 8000, 12000, float("inf")]
-    labels = ["0-2K(Low)", "2K-4K(Low)", "4K-6K(Mid)", "6K-8K(Mid)", "8K-12K(High)", ">=12K(High)"]
-    if df['Price_numeric'].notna().any():
-        df['Price Range'] = pd.cut(df['Price_numeric'], bins=bins, labels=labels)
-    else:
-        df['Price Range'] = pd.Series([np.nan] * len(df))
-
-    # Group and aggregate with safe functions
-    agg_dict = {
-        "Spec Score": "mean",
-        "Rating": "mean",
-        "Price_numeric": "mean",
-        "Price Range": lambda x: _safe_mode(x, default="Unknown"),
-        "Processor Family": lambda x: _safe_mode(x, default="Unknown"),
-        "RAM_GB": lambda x: _safe_mode(x, default=np.nan),
-        "Storage_GB": lambda x: _safe_mode(x, default=np.nan),
-    }
+def process_mobile_trends(input_path, output_path, store_path=None, backend='pandas'):
+    df = _load_features(input_path, store_path, TREND_COLUMNS)
 
     # Ensure Brand Family exists to group by; if not, create Unknown group
     if 'Brand Family' not in df.columns:
         df['Brand Family'] = 'Unknown'
 
-    trend_df = df.groupby("Brand Family").agg(agg_dict).reset_index()
+    trend_df = aggregate_trends(df, backend)
 
     # Clean up numeric columns and formatting
     numeric_cols = ["Spec Score", "Rating", "Price_numeric"]
@@ -113,16 +83,17 @@ def visualize_trends(trend_df, title="Trends in Mobile Phones by Brand Family",
     finally:
         plt.close()
 
-def analyze_mobile_trends():
+def analyze_mobile_trends(backend='pandas'):
     processed_dir = 'data/processed'
     os.makedirs(processed_dir, exist_ok=True)
 
     # Launched Phones
     launched_path = 'data/preprocess/mobile_launched_cleaned.csv'
+    launched_store = 'data/preprocess/mobile_launched_features.bin'
     launched_output = os.path.join(processed_dir, 'brand_family_trends.csv')
     launched_trends = None
     try:
-        launched_trends = process_mobile_trends(launched_path, launched_output)
+        launched_trends = process_mobile_trends(launched_path, launched_output, launched_store, backend)
         print("Brand family trends saved to", launched_output)
         print(launched_trends.head())
     except FileNotFoundError:
@@ -133,10 +104,11 @@ def analyze_mobile_trends():
 
     # Upcoming Phones
     upcoming_path = 'data/preprocess/mobile_upcoming_cleaned.csv'
+    upcoming_store = 'data/preprocess/mobile_upcoming_features.bin'
     upcoming_output = os.path.join(processed_dir, 'upcoming_brand_family_trends.csv')
     upcoming_trends = None
     try:
-        upcoming_trends = process_mobile_trends(upcoming_path, upcoming_output)
+        upcoming_trends = process_mobile_trends(upcoming_path, upcoming_output, upcoming_store, backend)
         print("Upcoming and Rumored brand family trends saved to", upcoming_output)
         if upcoming_trends is not None:
             print("Top 10 Upcoming Brands by Spec Score:")
@@ -155,3 +127,156 @@ def analyze_mobile_trends():
     print("Mobile trends analysis completed.")
     print('=' * 50)
     return launched_trends, upcoming_trends
+
+FAMILY_COLUMNS = ['Brand Family', 'Processor Family']
+
+def _family_vocab(df):
+    vocab = []
+    for col in FAMILY_COLUMNS:
+        if col not in df.columns:
+            continue
+        for val in sorted(df[col].dropna().astype(str).unique()):
+            vocab.append(f"{col}={val}")
+    return vocab
+
+def build_feature_matrix(df, family_vocab=None):
+    if family_vocab is None:
+        family_vocab = _family_vocab(df)
+    n_spec = len(SPEC_FEATURES)
+    X = np.empty((len(df), n_spec + len(family_vocab)), dtype=np.float64)
+    for i, (name, col, pattern) in enumerate(SPEC_FEATURES):
+        # Frames loaded from the feature store already carry the parsed values
+        if name in df.columns:
+            X[:, i] = df[name].to_numpy(dtype=np.float64)
+        else:
+            X[:, i] = extract_numeric(df, col, pattern)
+
+    # One-hot families via vocabulary positions; values unseen at fit time map to all zeros
+    X[:, n_spec:] = 0.0
+    offset = n_spec
+    for col in FAMILY_COLUMNS:
+        prefix = f"{col}="
+        cats = [v[len(prefix):] for v in family_vocab if v.startswith(prefix)]
+        if cats and col in df.columns:
+            codes = pd.Index(cats).get_indexer(df[col].astype(str))
+            rows = np.nonzero(codes >= 0)[0]
+            X[rows, offset + codes[rows]] = 1.0
+        offset += len(cats)
+
+    feature_names = [name for name, _, _ in SPEC_FEATURES] + list(family_vocab)
+    return X, feature_names
+
+def fit_spec_model(df, target='Spec Score', alpha=1.0):
+    if target not in df.columns:
+        raise KeyError(f"Target column not found: {target}")
+    y = pd.to_numeric(df[target], errors='coerce').to_numpy(dtype=np.float64)
+    X, feature_names = build_feature_matrix(df)
+    X, y = X[~np.isnan(y)], y[~np.isnan(y)]
+    if len(y) == 0:
+        raise ValueError(f"No numeric values to fit for target: {target}")
+
+    # Impute missing specs with the training mean, then standardize
+    observed = ~np.isnan(X)
+    counts = observed.sum(axis=0)
+    fill = np.divide(np.where(observed, X, 0.0).sum(axis=0), counts,
+                     out=np.zeros(X.shape[1]), where=counts > 0)
+    X = np.where(np.isnan(X), fill, X)
+    mean = X.mean(axis=0)
+    scale = X.std(axis=0)
+    scale[scale == 0] = 1.0
+    Z = (X - mean) / scale
+
+    # Closed-form ridge regression on centered data
+    y_mean = y.mean()
+    gram = Z.T @ Z + alpha * np.eye(Z.shape[1])
+    coef = np.linalg.solve(gram, Z.T @ (y - y_mean))
+
+    # Fold standardization into the weights so scoring is a single matmul
+    weights = coef / scale
+    return {
+        'target': target,
+        'feature_names': np.array(feature_names),
+        'fill': fill,
+        'weights': weights,
+        'intercept': float(y_mean - mean @ weights),
+        'alpha': float(alpha),
+        'source': None,
+    }
+
+def save_model(model, path):
+    _ensure_output_dir(path)
+    with open(path, 'wb') as f:
+        np.savez(f, target=np.array(model['target']), feature_names=model['feature_names'],
+                 fill=model['fill'], weights=model['weights'],
+                 intercept=np.array(model['intercept']), alpha=np.array(model['alpha']),
+                 source=np.array(model['source'] or ''))
+
+def load_model(path):
+    if not os.path.isfile(path):
+        raise FileNotFoundError(f"Model file not found: {path}")
+    with np.load(path, allow_pickle=False) as data:
+        return {
+            'target': str(data['target']),
+            'feature_names': data['feature_names'],
+            'fill': data['fill'],
+            'weights': data['weights'],
+            'intercept': float(data['intercept']),
+            'alpha': float(data['alpha']),
+            'source': (str(data['source']) or None) if 'source' in data.files else None,
+        }
+
+def predict_batch(model, df, batch_size=500_000):
+    n_spec = len(SPEC_FEATURES)
+    family_vocab = [str(v) for v in model['feature_names'][n_spec:]]
+    preds = np.empty(len(df), dtype=np.float64)
+    for start in range(0, len(df), batch_size):
+        chunk = df.iloc[start:start + batch_size]
+        X, _ = build_feature_matrix(chunk, family_vocab)
+        X = np.where(np.isnan(X), model['fill'], X)
+        preds[start:start + len(chunk)] = X @ model['weights'] + model['intercept']
+    return preds
+
+def _file_digest(path):
+    # Content hash, so rewriting an unchanged catalog (as main() does every run) keeps the model
+    if not os.path.isfile(path):
+        return None
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    return h.hexdigest()
+
+def _load_or_fit_model(train_path, train_store_path, model_path, target, alpha, refit):
+    # Reuse the serialized model only while it was fitted on the current launched
+    # catalog with the same alpha; otherwise inference would score with a stale fit
+    source = _file_digest(train_path)
+    if not refit and source is not None and os.path.isfile(model_path):
+        model = load_model(model_path)
+        if model['target'] == target and model['source'] == source and model['alpha'] == float(alpha):
+            return model
+    model = fit_spec_model(_load_features(train_path, train_store_path), target=target, alpha=alpha)
+    model['source'] = source
+    save_model(model, model_path)
+    return model
+
+def predict_upcoming_phones(launched_path='data/preprocess/mobile_launched_cleaned.csv',
+                            upcoming_path='data/preprocess/mobile_upcoming_cleaned.csv',
+                            output_path='data/processed/upcoming_predictions.csv',
+                            model_dir='data/models', alpha=1.0, refit=False,
+                            launched_store_path='data/preprocess/mobile_launched_features.bin',
+                            upcoming_store_path='data/preprocess/mobile_upcoming_features.bin'):
+    df_upcoming = _safe_read_csv(upcoming_path)
+    # Score from the mapped store when it is current instead of re-extracting specs from text
+    store = load_current_store(upcoming_store_path, upcoming_path)
+    features = df_upcoming if store is None else feature_store_to_frame(store)
+    targets = {'Spec Score': 'upcoming_score', 'Price_numeric': 'Predicted Price'}
+    for target, out_col in targets.items():
+        model_path = os.path.join(model_dir, f"{target.lower().replace(' ', '_')}_model.npz")
+        model = _load_or_fit_model(launched_path, launched_store_path, model_path, target, alpha, refit)
+        df_upcoming[out_col] = predict_batch(model, features)
+
+    df_upcoming['upcoming_score'] = df_upcoming['upcoming_score'].round(2)
+    df_upcoming['Predicted Price'] = df_upcoming['Predicted Price'].clip(lower=0).round(2)
+    _ensure_output_dir(output_path)
+    df_upcoming.to_csv(output_path, index=False)
+    return df_upcoming
@@ -237,27 +237,33 @@ def save_categories(df, out_dir='data/preprocess'):
     upcoming_rumored_df.to_csv(upcoming_path, index=False)
     return launched_path, upcoming_path
 
-def preprocess_mobile_data(raw_path='data/raw/mobile.csv', preprocess_dir='data/preprocess'):
+def transform_mobile_data(df):
+    df = standardize_and_fill(df)
+    df = split_processor(df)
+    df = split_sim(df)
+    df = split_storage(df)
+    df = split_battery(df)
+    df = split_display_col(df)
+    df = clean_memory_external(df)
+    df = rearrange_columns(df)
+    return df
+
+def preprocess_mobile_data(raw_path='data/raw/mobile.csv', preprocess_dir='data/preprocess',
+                           clean=initial_cleaning, transform=transform_mobile_data):
+    # clean/transform default to the pandas steps; src.backends supplies alternatives
     os.makedirs(preprocess_dir, exist_ok=True)
     df_mobile = load_mobile_data(raw_path)
     df_rename = rename_columns(df_mobile)
-    df_mobile_cleaned = initial_cleaning(df_rename)
+    df_mobile_cleaned = clean(df_rename)
     cleaned_path = os.path.join(preprocess_dir, 'mobile_cleaned.csv')
     df_mobile_cleaned.to_csv(cleaned_path, index=False)
 
     df_mobile = pd.read_csv(cleaned_path)
-    df_mobile = standardize_and_fill(df_mobile)
-    df_mobile = split_processor(df_mobile)
-    df_mobile = split_sim(df_mobile)
-    df_mobile = split_storage(df_mobile)
-    df_mobile = split_battery(df_mobile)
-    df_mobile = split_display_col(df_mobile)
-    df_mobile = clean_memory_external(df_mobile)
-    df_mobile = rearrange_columns(df_mobile)
+    df_mobile = transform(df_mobile)
     final_cleaned_path = os.path.join(preprocess_dir, 'mobile_final_cleaned.csv')
     df_mobile.to_csv(final_cleaned_path, index=False)
 
     df_mobile_cleaned = pd.read_csv(final_cleaned_path)
     save_categories(df_mobile_cleaned, preprocess_dir)
 
-    return df_mobile_cleaned
\ No newline at end of file
+    return df_mobile_cleaned
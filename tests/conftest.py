@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+
+def _catalog(n=200, seed=0, spec_from_ram=False, missing_ram=False):
+    # Raw catalog rows as preprocess writes them. spec_from_ram makes Spec Score and Price
+    # exact linear functions of RAM so model tests can check what was learned
+    rng = np.random.default_rng(seed)
+    ram = rng.choice([4, 8, 12], n)
+    if spec_from_ram:
+        spec_score, price = 60 + 2 * ram, 1000 * ram
+    else:
+        spec_score, price = rng.integers(60, 95, n), rng.integers(1000, 90000, n)
+    ram_text = np.array([f"{r} gb ram" for r in ram], dtype=object)
+    if missing_ram:
+        ram_text[rng.random(n) < 0.25] = None
+    return pd.DataFrame({
+        'Brand Name': rng.choice(['samsung galaxy', 'apple iphone', 'oneplus 12', 'vivo x'], n),
+        'Spec Score': spec_score,
+        'Rating': rng.uniform(3, 5, n).round(1),
+        'Price': price,
+        'Processor Name': rng.choice(['snapdragon 8', 'bionic a17', 'dimensity 9200'], n),
+        'Image Preview': 'http://x',
+        'RAM': ram_text,
+        'Internal Storage': rng.choice(['128 gb inbuilt', '256 gb inbuilt'], n),
+        'Display Size': '6.5 inch',
+        'Battery Capacity': '5000mAh 33W',
+    })
+
+
+@pytest.fixture
+def make_catalog():
+    return _catalog
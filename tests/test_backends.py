@@ -0,0 +1,126 @@
+import io
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("polars")
+
+from src.backends import aggregate_trends, clean_catalog, get_backend, transform_catalog
+from src.data_process import (
+    LAUNCHED_BRAND_FAMILIES, LAUNCHED_PROCESSOR_FAMILIES, process_launched_data, process_upcoming_data,
+)
+from src.preprocess import preprocess_mobile_data, rename_columns
+
+
+def _assert_same_frame(left, right):
+    # String storage (object, str, arrow) and categoricals may differ between
+    # backends, but numeric columns must agree on int vs float: it changes the CSV text
+    def normalize(df):
+        df = df.reset_index(drop=True)
+        cat_cols = [c for c in df.columns if isinstance(df[c].dtype, pd.CategoricalDtype)]
+        return df.astype({c: object for c in cat_cols})
+    left, right = normalize(left), normalize(right)
+    pd.testing.assert_frame_equal(left, right, check_dtype=False)
+    for c in left.columns:
+        kinds = (left[c].dtype.kind, right[c].dtype.kind)
+        if any(k in 'iuf' for k in kinds) and kinds[0] != kinds[1]:
+            raise AssertionError(f"Column {c!r} has dtype {left[c].dtype} vs {right[c].dtype}")
+
+
+def _check_backend_parity(raw_df, trend_df=None, backend='polars', reference='pandas'):
+    # Raises AssertionError on the first stage whose outputs differ between backends
+    cleaned = clean_catalog(raw_df, reference)
+    _assert_same_frame(cleaned, clean_catalog(raw_df, backend))
+    transformed = transform_catalog(cleaned, reference)
+    _assert_same_frame(transformed, transform_catalog(cleaned, backend))
+    steps, other = get_backend(reference), get_backend(backend)
+    families = (LAUNCHED_BRAND_FAMILIES, LAUNCHED_PROCESSOR_FAMILIES)
+    _assert_same_frame(steps['families'](transformed.copy(), *families), other['families'](transformed.copy(), *families))
+    _assert_same_frame(steps['ranges'](transformed.copy()), other['ranges'](transformed.copy()))
+    if trend_df is not None:
+        _assert_same_frame(aggregate_trends(trend_df, reference), aggregate_trends(trend_df, backend))
+
+
+def _raw_catalog(n=400, seed=0):
+    rng = np.random.default_rng(seed)
+
+    def pick(values):
+        return rng.choice(np.array(values, dtype=object), n)
+
+    df = pd.DataFrame({
+        'Name': pick(['Samsung Galaxy S24', 'Apple iPhone 15', ' ', 'Vivo X100', None]),
+        'price': pick([12999, 45000, 8999, None]),
+        'Spec Score': pick([80, 85, 90, None]),
+        'rating': pick([4.5, 4.0, None, 3.5]),
+        'tag': pick(['Launched', 'Upcoming', 'rumored', ' ']),
+        'sim': pick(['Dual Sim, 3G, 4G, 5G, VoLTE, Wi-Fi, NFC', 'Dual Sim, 3G, 4G, VoLTE', 'Single Sim, 4G', None, ', ,']),
+        'processor': pick(['Snapdragon 8 Gen 3, Octa Core, 3.3 GHz Processor', 'Bionic A17, Hexa Core', 'Dimensity 9200', None]),
+        'storage': pick(['8 GB RAM, 128 GB inbuilt', '12 GB RAM', '  ', None]),
+        'battery': pick(['5000 mAh Battery with 67W Fast Charging', '4500mAh battery', '3000 mah', None, 'big battery']),
+        'display': pick(['6.7 inches, 1440 x 3120 px, 120 Hz Display with Punch Hole', '6.1 inches, 1170×2532 px', '6 inch 90hz', None]),
+        'camera': pick(['50 MP', '12 MP', None]),
+        'memoryExternal': pick(['Yes', 'No', 'Memory Card Not Supported', None]),
+        'version': pick(['Android v14', 'iOS 17', None]),
+        'fm': pick(['fm', '']),
+        'img': pick(['http://x', ' ', None]),
+    })
+    # Round-trip through CSV so dtypes match what load_mobile_data sees
+    buf = io.StringIO()
+    df.to_csv(buf, index=False)
+    buf.seek(0)
+    return pd.read_csv(buf)
+
+
+def _trend_input(n=400, seed=1):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'Brand Family': rng.choice(np.array(['Apple', 'Samsung', None, 'Vivo'], dtype=object), n),
+        'Spec Score': rng.uniform(60, 90, n),
+        'Rating': rng.uniform(3, 5, n),
+        'Price_numeric': rng.choice([1500.0, 3000.0, 25000.0, np.nan, -5.0, 2000.0], n),
+        'Processor Family': rng.choice(np.array(['Bionic', 'Snapdragon', 'Unknown', None], dtype=object), n),
+        'RAM_GB': rng.choice([8.0, 12.0, np.nan], n),
+        'Storage_GB': rng.choice([128.0, 256.0, np.nan], n),
+    })
+
+
+def test_backend_parity():
+    _check_backend_parity(rename_columns(_raw_catalog()), _trend_input())
+
+
+def test_polars_keeps_integer_columns():
+    cleaned = clean_catalog(rename_columns(_raw_catalog()).dropna(subset=['Price', 'Spec Score']))
+    cleaned = cleaned.astype({'Price': 'int64', 'Spec Score': 'int64'})
+    for backend in ('pandas', 'polars'):
+        out = transform_catalog(cleaned, backend)
+        assert out['Price'].dtype.kind == 'i'
+        assert out['Spec Score'].dtype.kind == 'i'
+
+
+def test_trend_groups_sorted_by_brand():
+    trends = aggregate_trends(_trend_input(), 'polars')
+    assert list(trends['Brand Family']) == ['Apple', 'Samsung', 'Vivo']
+
+
+@pytest.mark.parametrize('complete', [False, True])
+def test_preprocess_outputs_identical(tmp_path, complete):
+    raw = _raw_catalog()
+    if complete:
+        # No gaps, so Price and Spec Score stay integer columns through the pipeline
+        raw = raw.fillna({'price': 9999, 'Spec Score': 75}).astype({'price': 'int64', 'Spec Score': 'int64'})
+    raw_path = tmp_path / 'mobile.csv'
+    raw.to_csv(raw_path, index=False)
+    for backend in ('pandas', 'polars'):
+        steps = get_backend(backend)
+        out_dir = tmp_path / backend
+        preprocess_mobile_data(str(raw_path), str(out_dir), steps['clean'], steps['transform'])
+        process_launched_data(str(out_dir / 'mobile_launched.csv'), str(out_dir / 'mobile_launched_cleaned.csv'), None,
+                              steps['families'], steps['ranges'])
+        process_upcoming_data(str(out_dir / 'mobile_upcoming_rumored.csv'), str(out_dir / 'mobile_upcoming_cleaned.csv'), None,
+                              steps['families'], steps['ranges'])
+    names = sorted(os.listdir(tmp_path / 'pandas'))
+    assert names == sorted(os.listdir(tmp_path / 'polars'))
+    for name in names:
+        assert (tmp_path / 'pandas' / name).read_bytes() == (tmp_path / 'polars' / name).read_bytes(), name
@@ -0,0 +1,111 @@
+import os
+import struct
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data_process import process_launched_data
+from src.feature_store import (
+    MAGIC, feature_store_to_frame, load_current_store, open_feature_store, write_feature_store,
+)
+from src.mobile_prediction import process_mobile_trends
+
+
+def _plain(df):
+    # The store hands back dictionary columns as categoricals; compare by value
+    cat_cols = [c for c in df.columns if isinstance(df[c].dtype, pd.CategoricalDtype)]
+    return df.astype({c: object for c in cat_cols})
+
+
+def test_store_round_trip(tmp_path, make_catalog):
+    df = make_catalog(missing_ram=True)
+    df['Brand Family'] = df['Brand Name'].str.split().str[0]
+    path = str(tmp_path / 'features.bin')
+    write_feature_store(df, path)
+    store = open_feature_store(path)
+    assert store['n_rows'] == len(df)
+    assert isinstance(store['columns']['RAM_GB'], np.memmap)
+    frame = feature_store_to_frame(store, ['Price_numeric', 'Brand Family'])
+    # Both numeric and dictionary-coded columns are views of the mapping, not copies
+    assert np.shares_memory(frame['Price_numeric'].to_numpy(), store['columns']['Price_numeric'])
+    assert np.shares_memory(frame['Brand Family'].array.codes, store['columns']['Brand Family'])
+    np.testing.assert_array_equal(frame['Price_numeric'], df['Price'].astype(float))
+    assert list(frame['Brand Family'].astype(str)) == list(df['Brand Family'])
+    assert store['dictionaries']['Brand Family'] == sorted(df['Brand Family'].unique())
+
+
+def test_trends_match_csv_and_ignore_stale_store(tmp_path, make_catalog):
+    raw = tmp_path / 'launched.csv'
+    clean = str(tmp_path / 'launched_cleaned.csv')
+    store = str(tmp_path / 'launched_features.bin')
+    df = make_catalog(missing_ram=True)
+    df.to_csv(raw, index=False)
+    process_launched_data(str(raw), clean, store)
+    assert load_current_store(store, clean) is not None
+    from_store = process_mobile_trends(clean, str(tmp_path / 'a.csv'), store)
+    from_csv = process_mobile_trends(clean, str(tmp_path / 'b.csv'))
+    pd.testing.assert_frame_equal(_plain(from_store), _plain(from_csv), check_dtype=False)
+
+    # Same row count, different rows: the old store must not be used
+    df.iloc[::-1].to_csv(raw, index=False)
+    os.utime(raw)
+    process_launched_data(str(raw), clean, store_path=None)
+    assert load_current_store(store, clean) is None
+    stale = process_mobile_trends(clean, str(tmp_path / 'c.csv'), store)
+    fresh = process_mobile_trends(clean, str(tmp_path / 'd.csv'))
+    pd.testing.assert_frame_equal(_plain(stale), _plain(fresh))
+
+
+def test_failed_write_removes_temp_file(tmp_path, monkeypatch, make_catalog):
+    def fail(src, dst):
+        raise OSError("disk full")
+    monkeypatch.setattr(os, 'replace', fail)
+    with pytest.raises(OSError):
+        write_feature_store(make_catalog(missing_ram=True), str(tmp_path / 'features.bin'))
+    assert os.listdir(tmp_path) == []
+
+
+def test_store_in_use_keeps_old_file(tmp_path, monkeypatch, make_catalog):
+    path = str(tmp_path / 'features.bin')
+    write_feature_store(make_catalog(missing_ram=True), path)
+    before = open(path, 'rb').read()
+
+    def locked(src, dst):
+        raise PermissionError("mapped by another process")
+    monkeypatch.setattr(os, 'replace', locked)
+    assert write_feature_store(make_catalog(seed=1, missing_ram=True), path) is None
+    assert os.listdir(tmp_path) == ['features.bin']
+    assert open(path, 'rb').read() == before
+
+
+def _bump_version(path):
+    with open(path, 'rb') as f:
+        data = f.read()
+    (header_len,) = struct.unpack('<Q', data[len(MAGIC):len(MAGIC) + 8])
+    start = len(MAGIC) + 8
+    header = data[start:start + header_len].replace(b'"version": 1', b'"version": 9')
+    with open(path, 'wb') as f:
+        f.write(data[:start] + header + data[start + header_len:])
+
+
+@pytest.mark.parametrize('damage', ['garbage', 'truncated', 'version'])
+def test_damaged_store_falls_back_to_csv(tmp_path, damage, make_catalog):
+    raw = tmp_path / 'launched.csv'
+    clean = str(tmp_path / 'launched_cleaned.csv')
+    store = str(tmp_path / 'launched_features.bin')
+    make_catalog(missing_ram=True).to_csv(raw, index=False)
+    process_launched_data(str(raw), clean, store)
+    stat = os.stat(store)
+    if damage == 'garbage':
+        with open(store, 'wb') as f:
+            f.write(b'not a store at all')
+    elif damage == 'truncated':
+        with open(store, 'r+b') as f:
+            f.truncate(stat.st_size // 2)
+    else:
+        _bump_version(store)
+    assert load_current_store(store, clean) is None
+    from_damaged = process_mobile_trends(clean, str(tmp_path / 'a.csv'), store)
+    from_csv = process_mobile_trends(clean, str(tmp_path / 'b.csv'))
+    pd.testing.assert_frame_equal(_plain(from_damaged), _plain(from_csv))
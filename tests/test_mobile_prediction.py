@@ -0,0 +1,97 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data_process import process_launched_data, process_upcoming_data
+from src.feature_store import SPEC_FEATURES
+from src.mobile_prediction import (
+    build_feature_matrix, fit_spec_model, load_model, predict_batch, predict_upcoming_phones,
+)
+
+
+@pytest.fixture
+def linear_catalog(make_catalog):
+    # Spec Score and Price follow RAM exactly, so fitted predictions are checkable
+    def make(n=300, seed=0):
+        return make_catalog(n, seed, spec_from_ram=True)
+    return make
+
+
+@pytest.fixture
+def prepare(tmp_path, linear_catalog):
+    def run(launched):
+        launched.to_csv(tmp_path / 'launched.csv', index=False)
+        linear_catalog(20, 1).to_csv(tmp_path / 'upcoming.csv', index=False)
+        paths = {
+            'launched_path': str(tmp_path / 'launched_cleaned.csv'),
+            'upcoming_path': str(tmp_path / 'upcoming_cleaned.csv'),
+            'launched_store_path': str(tmp_path / 'launched_features.bin'),
+            'upcoming_store_path': str(tmp_path / 'upcoming_features.bin'),
+            'output_path': str(tmp_path / 'predictions.csv'),
+            'model_dir': str(tmp_path / 'models'),
+        }
+        process_launched_data(str(tmp_path / 'launched.csv'), paths['launched_path'], paths['launched_store_path'])
+        process_upcoming_data(str(tmp_path / 'upcoming.csv'), paths['upcoming_path'], paths['upcoming_store_path'])
+        return paths
+    return run
+
+
+def test_model_reused_while_training_data_unchanged(prepare, linear_catalog):
+    paths = prepare(linear_catalog())
+    first = predict_upcoming_phones(**paths)
+    model_path = os.path.join(paths['model_dir'], 'spec_score_model.npz')
+    saved = os.stat(model_path).st_mtime_ns
+    second = predict_upcoming_phones(**paths)
+    assert os.stat(model_path).st_mtime_ns == saved
+    np.testing.assert_array_equal(first['upcoming_score'], second['upcoming_score'])
+
+
+def test_model_kept_when_catalog_rewritten_unchanged(tmp_path, prepare, linear_catalog):
+    paths = prepare(linear_catalog())
+    predict_upcoming_phones(**paths)
+    model_path = os.path.join(paths['model_dir'], 'spec_score_model.npz')
+    saved = os.stat(model_path).st_mtime_ns
+    # main() reprocesses the catalog every run, rewriting identical bytes with a new mtime
+    process_launched_data(str(tmp_path / 'launched.csv'), paths['launched_path'], paths['launched_store_path'])
+    predict_upcoming_phones(**paths)
+    assert os.stat(model_path).st_mtime_ns == saved
+
+
+def test_model_refit_when_training_data_changes(prepare, linear_catalog):
+    paths = prepare(linear_catalog())
+    first = predict_upcoming_phones(**paths)
+
+    paths = prepare(linear_catalog().assign(**{'Spec Score': 10}))
+    second = predict_upcoming_phones(**paths)
+    assert not np.allclose(first['upcoming_score'], second['upcoming_score'])
+    np.testing.assert_allclose(second['upcoming_score'], 10, atol=0.01)
+
+
+def test_model_refit_when_alpha_changes(prepare, linear_catalog):
+    paths = prepare(linear_catalog())
+    predict_upcoming_phones(**paths)
+    predict_upcoming_phones(**paths, alpha=50.0)
+    assert load_model(os.path.join(paths['model_dir'], 'spec_score_model.npz'))['alpha'] == 50.0
+
+
+def test_unseen_families_and_missing_specs(linear_catalog):
+    train = linear_catalog().assign(**{'Brand Family': 'Samsung', 'Processor Family': 'Snapdragon'})
+    train.loc[::2, 'Brand Family'] = 'Apple'
+    model = fit_spec_model(train)
+    n_spec = len(SPEC_FEATURES)
+    vocab = [str(v) for v in model['feature_names'][n_spec:]]
+
+    unseen = train.head(3).assign(**{'Brand Family': 'Nubia', 'Processor Family': 'Xring'})
+    X, _ = build_feature_matrix(unseen, vocab)
+    assert (X[:, n_spec:] == 0).all()
+    X, _ = build_feature_matrix(train.head(3), vocab)
+    assert (X[:, n_spec:].sum(axis=1) == 2).all()
+
+    # A missing spec scores exactly like one at the training mean
+    ram_mean = pd.to_numeric(train['RAM'].str.extract(r'(\d+)', expand=False)).mean()
+    assert model['fill'][0] == pytest.approx(ram_mean)
+    missing = train.head(1).assign(RAM=None)
+    at_mean = train.head(1).assign(RAM=f"{ram_mean} gb ram")
+    np.testing.assert_allclose(predict_batch(model, missing), predict_batch(model, at_mean))